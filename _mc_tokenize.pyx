@@ -0,0 +1,50 @@
+# cython: language_level=3
+# _mc_tokenize.pyx
+"""
+Versão compilada (Cython) do tokenizador de meu_compilador.py.
+
+Opcional: o meu_compilador.py usa esta versão automaticamente se o módulo
+compilado estiver disponível; caso contrário cai na versão pura em Python.
+(O prefixo _mc_ evita colisão com o módulo builtin _tokenize do CPython,
+que teria precedência na importação.)
+
+Para compilar (requer Cython e um compilador C):
+    cythonize -i _mc_tokenize.pyx
+
+O padrão abaixo precisa espelhar o TOKEN_SPEC de meu_compilador.py.
+"""
+import re
+
+_MASTER = re.compile(
+    r"[ \t\r\n]*(?:"
+    r"(?P<KEYWORD>(?a:(?:break|continue|else|float|for|if|int|return|while)\b))"
+    r"|(?P<FLOAT>\d+\.\d+)"
+    r"|(?P<INT>\d+)"
+    r"|(?P<ID>[A-Za-z_][A-Za-z0-9_]*)"
+    r"|(?P<OP>[=!<>]=|[-+*/=])"
+    r"|(?P<LPAREN>\()"
+    r"|(?P<RPAREN>\))"
+    r"|(?P<SEMI>;)"
+    r"|(?P<COMMA>,)"
+    r"|(?P<UNKNOWN>[^ \t\r\n])"
+    r")"
+)
+
+
+cpdef list tokenize(str src):
+    """Retorna lista de tokens (tipo, valor, posição)."""
+    cdef list tokens = []
+    # iterador de scanner: um único objeto Match reaproveitado por chamada,
+    # sem o custo de criar o iterador de finditer em Python
+    scanner = _MASTER.scanner(src)
+    match = scanner.match
+    m = match()
+    while m is not None:
+        kind = m.lastgroup
+        val = m.group(kind)
+        pos = m.start(kind)
+        if kind == "UNKNOWN":
+            kind = "ERROR"
+        tokens.append((kind, val, pos))
+        m = match()
+    return tokens
@@ -1,268 +1,599 @@
-#!/usr/bin/env python3
-# meu_compilador.py
-"""
-Mini-projeto de Compiladores (versão alternativa)
-Funcionalidades:
- - Tokenizador (análise léxica)
- - Simulador de AFD (validação de identificadores)
- - Parser recursivo-descendente para expressões aritméticas
- - Menu interativo para testar tudo
-Autor: Versão adaptada para seu trabalho
-Requisitos: Python 3.8+
-Opcional: colorama (pip install colorama) para cores no terminal
-"""
-
-import re
-import sys
-
-# --------- cores (opcional) ----------
-try:
-    from colorama import init, Fore, Style
-    init(autoreset=True)
-except Exception:
-    class _D:
-        RESET = RED = GREEN = YELLOW = CYAN = MAGENTA = BLUE = ""
-    Fore = Style = _D()
-
-# ========= TOKENIZADOR =========
-# especificação de tokens (nome, regex)
-TOKEN_SPEC = [
-    ("FLOAT",   r"\d+\.\d+"),
-    ("INT",     r"\d+"),
-    ("ID",      r"[A-Za-z_][A-Za-z0-9_]*"),
-    ("OP",      r"==|!=|<=|>=|\+|\-|\*|/|="),
-    ("LPAREN",  r"\("),
-    ("RPAREN",  r"\)"),
-    ("SEMI",    r";"),
-    ("COMMA",   r","),
-    ("SKIP",    r"[ \t\r\n]+"),
-    ("UNKNOWN", r"."),
-]
-
-MASTER = re.compile("|".join(f"(?P<{n}>{p})" for n, p in TOKEN_SPEC))
-
-KEYWORDS = {"if", "else", "while", "return", "int", "float", "for", "break", "continue"}
-
-
-def tokenize(src: str):
-    """Retorna lista de tokens (tipo, valor, posição)."""
-    tokens = []
-    for m in MASTER.finditer(src):
-        kind = m.lastgroup
-        val = m.group()
-        pos = m.start()
-        if kind == "SKIP":
-            continue
-        if kind == "ID" and val in KEYWORDS:
-            kind = "KEYWORD"
-        if kind == "UNKNOWN":
-            tokens.append(("ERROR", val, pos))
-        else:
-            tokens.append((kind, val, pos))
-    return tokens
-
-
-# ========= AFD (simulador para identificadores) =========
-def afd_identificador(s: str) -> bool:
-    """
-    Aceita strings que seguem [A-Za-z_][A-Za-z0-9_]*
-    Implementado manualmente (sem regex) para fins didáticos.
-    """
-    if len(s) == 0:
-        return False
-    first = s[0]
-    if not (first.isalpha() or first == "_"):
-        return False
-    for ch in s[1:]:
-        if not (ch.isalnum() or ch == "_"):
-            return False
-    return True
-
-
-# ========= PARSER: AST classes e parser recursivo-descendente =========
-class AST:
-    pass
-
-class Number(AST):
-    def __init__(self, value: str):
-        self.value = value
-    def __repr__(self):
-        return f"Number({self.value})"
-
-class Identifier(AST):
-    def __init__(self, name: str):
-        self.name = name
-    def __repr__(self):
-        return f"Identifier({self.name})"
-
-class BinOp(AST):
-    def __init__(self, op: str, left: AST, right: AST):
-        self.op = op
-        self.left = left
-        self.right = right
-    def __repr__(self):
-        return f"BinOp({self.op}, {self.left}, {self.right})"
-
-
-class ExprLexer:
-    """Um lexer simples só para o parser de expressões (diferente do tokenizer principal)."""
-    TOKEN_RE = re.compile(r"\s*(?:(\d+\.\d+|\d+)|([A-Za-z_][A-Za-z0-9_]*)|(.))")
-
-    def __init__(self, text: str):
-        self.tokens = []
-        for m in ExprLexer.TOKEN_RE.finditer(text):
-            num, ident, other = m.groups()
-            if num:
-                # manter distinção int/float opcionalmente
-                if "." in num:
-                    self.tokens.append(("NUMBER", num))
-                else:
-                    self.tokens.append(("NUMBER", num))
-            elif ident:
-                self.tokens.append(("ID", ident))
-            elif other in "+-*/()":
-                self.tokens.append((other, other))
-            elif other == "":
-                continue
-            else:
-                self.tokens.append(("ERROR", other))
-        self.pos = 0
-
-    def peek(self):
-        return self.tokens[self.pos] if self.pos < len(self.tokens) else ("EOF", "")
-
-    def next(self):
-        t = self.peek()
-        self.pos += 1
-        return t
-
-# Gramática:
-# E -> T { (+|-) T }
-# T -> F { (*|/) F }
-# F -> NUMBER | ID | "(" E ")"
-
-def parse_expression(text: str) -> AST:
-    lex = ExprLexer(text)
-
-    def F():
-        tok = lex.peek()
-        if tok[0] == "NUMBER":
-            lex.next()
-            return Number(tok[1])
-        if tok[0] == "ID":
-            lex.next()
-            return Identifier(tok[1])
-        if tok[0] == "(":
-            lex.next()
-            node = E()
-            if lex.peek()[0] != ")":
-                raise SyntaxError("Parêntese de fechamento esperado")
-            lex.next()
-            return node
-        raise SyntaxError(f"Token inesperado em F: {tok}")
-
-    def T():
-        node = F()
-        while lex.peek()[0] in ("*", "/"):
-            op = lex.next()[0]
-            right = F()
-            node = BinOp(op, node, right)
-        return node
-
-    def E():
-        node = T()
-        while lex.peek()[0] in ("+", "-"):
-            op = lex.next()[0]
-            right = T()
-            node = BinOp(op, node, right)
-        return node
-
-    ast = E()
-    if lex.peek()[0] != "EOF":
-        raise SyntaxError("Entrada extra após expressão")
-    return ast
-
-
-def pretty_print_ast(node: AST, indent: int = 0):
-    pad = "  " * indent
-    if isinstance(node, BinOp):
-        print(pad + f"BINOP {node.op}")
-        pretty_print_ast(node.left, indent + 1)
-        pretty_print_ast(node.right, indent + 1)
-    elif isinstance(node, Number):
-        print(pad + f"NUMBER: {node.value}")
-    elif isinstance(node, Identifier):
-        print(pad + f"ID: {node.name}")
-    else:
-        print(pad + f"UNKNOWN_NODE: {node}")
-
-
-# ========= Funções de interface (menu) =========
-def run_tokenizer_interactive():
-    print(Fore.CYAN + "=== Tokenizador Interativo ===" + Style.RESET_ALL)
-    src = input("Cole um trecho de código: ")
-    toks = tokenize(src)
-    if not toks:
-        print(Fore.YELLOW + "Nenhum token encontrado.")
-        return
-    for t in toks:
-        typ, val, pos = t
-        if typ == "ERROR":
-            print(Fore.RED + f"{pos:04d}: ERRO -> {val}")
-        else:
-            print(Fore.GREEN + f"{pos:04d}: {typ:8s} -> {val}")
-
-
-def run_afd_interactive():
-    print(Fore.CYAN + "=== Simulador AFD (identificador) ===" + Style.RESET_ALL)
-    s = input("Digite uma string para validar como identificador: ").strip()
-    ok = afd_identificador(s)
-    if ok:
-        print(Fore.GREEN + "ACEITO: é um identificador válido.")
-    else:
-        print(Fore.RED + "REJEITADO: não é um identificador válido.")
-
-
-def run_parser_interactive():
-    print(Fore.CYAN + "=== Parser de Expressões (recursivo-descendente) ===" + Style.RESET_ALL)
-    expr = input("Digite uma expressão (ex: a + 3*(b-2)): ")
-    try:
-        ast = parse_expression(expr)
-        print(Fore.GREEN + "Árvore sintática:")
-        pretty_print_ast(ast)
-    except Exception as e:
-        print(Fore.RED + "Erro de sintaxe:", e)
-
-
-def show_help():
-    print(Fore.CYAN + "=== Ajuda Rápida ===" + Style.RESET_ALL)
-    print("Comandos básicos: digite o número da opção e Enter.")
-    print("1 - Tokenizador\n2 - Simulador AFD\n3 - Parser\n4 - Sair")
-
-
-def main():
-    actions = {
-        "1": run_tokenizer_interactive,
-        "2": run_afd_interactive,
-        "3": run_parser_interactive,
-        "4": lambda: sys.exit(0),
-    }
-    while True:
-        print(Fore.YELLOW + "\n--- MENU PRINCIPAL ---" + Style.RESET_ALL)
-        print("1) Tokenizador")
-        print("2) Simulador AFD")
-        print("3) Parser")
-        print("4) Sair")
-        choice = input("> ").strip()
-        action = actions.get(choice)
-        if action:
-            action()
-        else:
-            print(Fore.RED + "Opção inválida. Tente novamente.")
-
-
-if __name__ == "__main__":
-    try:
-        main()
-    except KeyboardInterrupt:
-        print("\nEncerrado pelo usuário.")
+#!/usr/bin/env python3
+# meu_compilador.py
+"""
+Mini-projeto de Compiladores (versão alternativa)
+Funcionalidades:
+ - Tokenizador (análise léxica)
+ - Simulador de AFD (validação de identificadores)
+ - Parser recursivo-descendente para expressões aritméticas
+ - Menu interativo para testar tudo
+Autor: Versão adaptada para seu trabalho
+Requisitos: Python 3.8+
+Opcional: colorama (pip install colorama) para cores no terminal
+"""
+
+import functools
+import re
+import sys
+from array import array
+
+# --------- cores (opcional) ----------
+# só inicializa o colorama quando a saída é um terminal: com stdout
+# redirecionado (pipe/arquivo) os códigos viram strings vazias e as
+# concatenações de cor não alocam nada
+class _D:
+    RESET_ALL = RESET = RED = GREEN = YELLOW = CYAN = MAGENTA = BLUE = ""
+
+Fore = Style = _D()
+if sys.stdout.isatty():
+    try:
+        from colorama import init, Fore, Style
+        init(autoreset=True)
+    except Exception:
+        pass
+
+# modelos de linha colorida pré-montados uma vez no import
+_HDR = Fore.CYAN + "{}" + Style.RESET_ALL
+_OK = Fore.GREEN + "{}"
+_ERR = Fore.RED + "{}"
+_WARN = Fore.YELLOW + "{}"
+
+# ========= TOKENIZADOR =========
+# mantida como frozenset público para quem consome o módulo; a
+# classificação em si acontece dentro da regex-mestre, abaixo
+KEYWORDS = frozenset(
+    map(sys.intern, ("if", "else", "while", "return", "int", "float", "for", "break", "continue"))
+)
+
+# especificação de tokens (nome, regex)
+TOKEN_SPEC = [
+    # palavras-chave antes de ID: o próprio motor de regex as classifica
+    # em uma passada. Só o \b final: o início já fica ancorado pelo scanner
+    # (um \b inicial impediria o KEYWORD em entradas como "3if", onde o
+    # baseline emite INT + KEYWORD). O (?a:...) deixa o \b ASCII, para que
+    # "ifá" siga sendo KEYWORD + ERROR como na classificação por valor
+    ("KEYWORD", r"(?a:(?:" + "|".join(sorted(KEYWORDS)) + r")\b)"),
+    ("FLOAT",   r"\d+\.\d+"),
+    ("INT",     r"\d+"),
+    ("ID",      r"[A-Za-z_][A-Za-z0-9_]*"),
+    # mais longos primeiro e prefixos fatorados: menos alternativas
+    # para o motor de regex testar por caractere
+    ("OP",      r"[=!<>]=|[-+*/=]"),
+    ("LPAREN",  r"\("),
+    ("RPAREN",  r"\)"),
+    ("SEMI",    r";"),
+    ("COMMA",   r","),
+    ("UNKNOWN", r"[^ \t\r\n]"),
+]
+
+# o [ \t\r\n]* na frente consome o espaço em branco dentro do próprio
+# casamento: nenhum token SKIP é emitido e o laço do tokenizador fica sem
+# esse desvio (o conjunto é o mesmo do SKIP original — \s pegaria também
+# \v, \f e espaços Unicode, que devem continuar virando ERROR)
+MASTER = re.compile(
+    r"[ \t\r\n]*(?:" + "|".join(f"(?P<{n}>{p})" for n, p in TOKEN_SPEC) + r")"
+)
+
+
+def tokenize(src: str):
+    """Retorna lista de tokens (tipo, valor, posição)."""
+    # pré-aloca por estimativa e preenche por índice, evitando o custo
+    # amortizado de realocação do append; o excesso é cortado no final
+    cap = max(16, len(src) // 4)
+    tokens = [None] * cap
+    n = 0
+    # itera com o scanner da regex em vez de finditer: sem criar o
+    # iterador intermediário, com o método match já resolvido num local
+    match = MASTER.scanner(src).match
+    m = match()
+    while m is not None:
+        kind = m.lastgroup
+        # valor e posição do grupo nomeado, não do casamento inteiro
+        # (que inclui o espaço em branco consumido pelo \s*)
+        val = m.group(kind)
+        pos = m.start(kind)
+        if kind == "UNKNOWN":
+            kind = "ERROR"
+        if n == cap:
+            tokens.extend([None] * cap)
+            cap *= 2
+        tokens[n] = (kind, val, pos)
+        n += 1
+        m = match()
+    del tokens[n:]
+    return tokens
+
+
+# aceleração opcional: versão compilada do tokenizador (Cython).
+# Gere o módulo com `cythonize -i _mc_tokenize.pyx`; sem ele, vale a
+# versão pura em Python definida acima. (O nome tem o prefixo _mc_
+# porque "_tokenize" é um módulo builtin do CPython desde o 3.11 e
+# builtins têm precedência sobre o sys.path.)
+try:
+    from _mc_tokenize import tokenize  # noqa: F811
+except ImportError:
+    pass
+
+
+# ========= AFD (simulador para identificadores) =========
+# a mesma linguagem do AFD, como regex compilada uma vez no import:
+# o fullmatch percorre a string inteira dentro do motor em C
+_ID_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# tabela de classes de caracteres do AFD, indexada pelo byte ASCII:
+# 0 = rejeita, 1 = letra ou '_', 2 = dígito (construída uma vez no import)
+_CLS = bytes(
+    2 if chr(i).isdigit() else 1 if (chr(i).isalpha() or chr(i) == "_") else 0
+    for i in range(128)
+) + bytes(128)
+
+
+def afd_identificador(s: str) -> bool:
+    """
+    Aceita strings que seguem [A-Za-z_][A-Za-z0-9_]*
+    AFD dirigido por tabela: cada caractere vira um índice na tabela de
+    classes _CLS, sem chamadas de método por caractere (as versões com
+    regex e com laço manual ficam abaixo, para comparação didática).
+    """
+    b = s.encode("ascii", "replace")
+    if not b or _CLS[b[0]] != 1:
+        return False
+    return all(_CLS[c] for c in b[1:])
+
+
+# validação em lote (opcional): numba + numpy compilam o AFD para código
+# nativo, com um único desvio por byte; sem eles, vale o laço em Python
+try:
+    import numpy as _np
+    from numba import njit as _njit
+
+    @_njit(cache=True)
+    def _afd_batch(buf, offsets, lengths, out):
+        for i in range(lengths.shape[0]):
+            start = offsets[i]
+            n = lengths[i]
+            if n == 0 or _NB_CLS[buf[start]] != 1:
+                out[i] = 0
+                continue
+            ok = 1
+            for j in range(start + 1, start + n):
+                if _NB_CLS[buf[j]] == 0:
+                    ok = 0
+                    break
+            out[i] = ok
+
+    _NB_CLS = _np.frombuffer(_CLS, dtype=_np.uint8)
+
+    def afd_identificadores_lote(ids):
+        """Valida uma lista de strings de uma vez (versão compilada)."""
+        if not ids:
+            return []
+        joined = "".join(ids).encode("ascii", "replace")
+        buf = _np.frombuffer(joined, dtype=_np.uint8)
+        lengths = _np.array([len(s) for s in ids], dtype=_np.int64)
+        offsets = _np.concatenate((_np.zeros(1, dtype=_np.int64), lengths.cumsum()[:-1]))
+        out = _np.empty(len(ids), dtype=_np.uint8)
+        _afd_batch(buf, offsets, lengths, out)
+        return [bool(v) for v in out]
+except Exception:
+    def afd_identificadores_lote(ids):
+        """Valida uma lista de strings de uma vez (versão pura em Python)."""
+        return [afd_identificador(s) for s in ids]
+
+
+def afd_identificador_regex(s: str) -> bool:
+    """
+    Aceita strings que seguem [A-Za-z_][A-Za-z0-9_]*
+    Variante com fullmatch de regex pré-compilada.
+    """
+    return bool(s) and _ID_RE.fullmatch(s) is not None
+
+
+def afd_identificador_manual(s: str) -> bool:
+    """
+    Aceita strings que seguem [A-Za-z_][A-Za-z0-9_]*
+    Implementado manualmente (sem regex) para fins didáticos.
+    """
+    if len(s) == 0:
+        return False
+    first = s[0]
+    if not (first.isalpha() or first == "_"):
+        return False
+    for ch in s[1:]:
+        if not (ch.isalnum() or ch == "_"):
+            return False
+    return True
+
+
+# ========= PARSER: AST classes e parser recursivo-descendente =========
+# __slots__ em todos os nós: sem __dict__ por instância, os atributos
+# viram acessos por deslocamento fixo e cada nó ocupa menos da metade
+# da memória — nenhum nó recebe atributos dinâmicos
+class AST:
+    __slots__ = ()
+
+class Number(AST):
+    __slots__ = ("value",)
+    def __init__(self, value: str):
+        self.value = value
+    def __repr__(self):
+        return f"Number({self.value})"
+
+class Identifier(AST):
+    __slots__ = ("name",)
+    def __init__(self, name: str):
+        self.name = name
+    def __repr__(self):
+        return f"Identifier({self.name})"
+
+class BinOp(AST):
+    __slots__ = ("op", "left", "right")
+    def __init__(self, op: str, left: AST, right: AST):
+        self.op = op
+        self.left = left
+        self.right = right
+    def __repr__(self):
+        return f"BinOp({self.op}, {self.left}, {self.right})"
+
+
+# regex-mestre do lexer de expressões, com grupos nomeados para despachar
+# por m.lastgroup (uma busca em dict por token, em vez de testar cada
+# grupo em Python); a fábrica com cache garante uma única compilação por
+# processo mesmo que venha a ser chamada de novo — o cache interno do
+# próprio re.compile é LRU e pode descartar padrões quentes
+@functools.lru_cache(maxsize=None)
+def _expr_re():
+    return re.compile(
+        r"(?P<NUM>\d+\.\d+|\d+)|(?P<ID>[A-Za-z_][A-Za-z0-9_]*)"
+        r"|(?P<OP>[-+*/()])|(?P<WS>\s+)|(?P<ERR>.)"
+    )
+
+
+# pré-aquecida no import: o custo de compilar é pago na carga do módulo,
+# nunca dentro do laço do parser
+_EXPR_TOKEN_RE = _expr_re()
+
+# códigos inteiros de tipo de token: cabem em um byte, então o array de
+# tipos é um array('B') e cada decisão do parser compara dois ints
+_K_EOF = 0
+_K_NUMBER = 1
+_K_ID = 2
+_K_LPAREN = 3
+_K_RPAREN = 4
+_K_PLUS = 5
+_K_MINUS = 6
+_K_STAR = 7
+_K_SLASH = 8
+_K_ERROR = 9
+
+# código -> nome legível (para mensagens de erro e para montar BinOp.op)
+_KIND_NAMES = ("EOF", "NUMBER", "ID", "(", ")", "+", "-", "*", "/", "ERROR")
+
+# nome do grupo / caractere de operador -> código
+_TOKEN_DISPATCH = {"NUM": _K_NUMBER, "ID": _K_ID, "ERR": _K_ERROR}
+_OP_CODES = {"+": _K_PLUS, "-": _K_MINUS, "*": _K_STAR, "/": _K_SLASH,
+             "(": _K_LPAREN, ")": _K_RPAREN}
+
+# precedência indexada pelo código do token (0 = não é operador binário)
+_prec = bytearray(len(_KIND_NAMES))
+_prec[_K_PLUS] = _prec[_K_MINUS] = 1
+_prec[_K_STAR] = _prec[_K_SLASH] = 2
+_PREC_TAB = bytes(_prec)
+del _prec
+
+
+class ExprLexer:
+    """
+    Um lexer simples só para o parser de expressões (diferente do tokenizer
+    principal). Os tokens ficam em arrays paralelos: códigos de tipo em um
+    array de bytes, valores em uma lista de strings e posições iniciais em
+    um array de ints — o laço do parser decide tudo lendo um byte por
+    token, sem alocar tupla nenhuma.
+    """
+    TOKEN_RE = _EXPR_TOKEN_RE
+
+    def __init__(self, text: str):
+        self.kinds = array("B")
+        self.values = []
+        self.starts = array("i")
+        # apelidos locais dos bound methods: uma busca de atributo no
+        # total, em vez de três por token
+        kind_append = self.kinds.append
+        value_append = self.values.append
+        start_append = self.starts.append
+        for m in _EXPR_TOKEN_RE.finditer(text):
+            kind = m.lastgroup
+            if kind == "WS":
+                continue
+            val = m.group()
+            if kind == "OP":
+                kind_append(_OP_CODES[val])
+            else:
+                kind_append(_TOKEN_DISPATCH[kind])
+            value_append(val)
+            start_append(m.start())
+        self.pos = 0
+
+    def peek_kind(self):
+        return self.kinds[self.pos] if self.pos < len(self.kinds) else _K_EOF
+
+    def peek(self):
+        pos = self.pos
+        if pos < len(self.kinds):
+            return (self.kinds[pos], self.values[pos])
+        return (_K_EOF, "")
+
+    def next(self):
+        t = self.peek()
+        self.pos += 1
+        return t
+
+# Gramática:
+# E -> T { (+|-) T }
+# T -> F { (*|/) F }
+# F -> NUMBER | ID | "(" E ")"
+
+def parse_expression(text: str) -> AST:
+    """
+    Analisa uma expressão com um laço único de precedência de operadores
+    (shunting-yard), usando pilhas explícitas de operandos e operadores em
+    vez de recursão — sem custo de chamada por operador e sem limite de
+    profundidade. Cada decisão do laço compara códigos de um byte via a
+    tabela _PREC_TAB. A versão recursiva-descendente clássica fica em
+    parse_expression_recursivo, para fins didáticos.
+    """
+    operands = []
+    ops = []  # códigos de operadores pendentes e o sentinela _K_LPAREN
+    expect_operand = True
+    prec_tab = _PREC_TAB
+
+    def _reduce():
+        op = ops.pop()
+        right = operands.pop()
+        operands.append(BinOp(_KIND_NAMES[op], operands.pop(), right))
+
+    lex = ExprLexer(text)
+    for pos, kind in enumerate(lex.kinds):
+        if expect_operand:
+            if kind == _K_NUMBER:
+                operands.append(Number(lex.values[pos]))
+                expect_operand = False
+            elif kind == _K_ID:
+                operands.append(Identifier(lex.values[pos]))
+                expect_operand = False
+            elif kind == _K_LPAREN:
+                ops.append(_K_LPAREN)
+            else:
+                tok = (_KIND_NAMES[kind], lex.values[pos])
+                raise SyntaxError(
+                    f"Token inesperado em F: {tok} (posição {lex.starts[pos]})"
+                )
+        else:
+            prec = prec_tab[kind]
+            if prec:
+                while ops and ops[-1] != _K_LPAREN and prec_tab[ops[-1]] >= prec:
+                    _reduce()
+                ops.append(kind)
+                expect_operand = True
+            elif kind == _K_RPAREN:
+                while ops and ops[-1] != _K_LPAREN:
+                    _reduce()
+                if not ops:
+                    raise SyntaxError(
+                        f"Entrada extra após expressão (posição {lex.starts[pos]})"
+                    )
+                ops.pop()
+            else:
+                # com um "(" ainda aberto, o token estranho significa que
+                # faltou fechar o parêntese — mesma mensagem do recursivo
+                if _K_LPAREN in ops:
+                    raise SyntaxError("Parêntese de fechamento esperado")
+                raise SyntaxError(
+                    f"Entrada extra após expressão (posição {lex.starts[pos]})"
+                )
+    if expect_operand:
+        raise SyntaxError(f"Token inesperado em F: {('EOF', '')}")
+    while ops:
+        if ops[-1] == _K_LPAREN:
+            raise SyntaxError("Parêntese de fechamento esperado")
+        _reduce()
+    return operands[0]
+
+
+def parse_expression_recursivo(text: str) -> AST:
+    """
+    Versão recursiva-descendente da gramática acima (didática), com
+    memoização packrat: cada não-terminal guarda (nó, nova posição) por
+    posição de entrada, garantindo tempo O(n) mesmo se a gramática
+    ganhar alternativas com retrocesso no futuro.
+    """
+    lex = ExprLexer(text)
+    # arrays do lexer e posição como locais do parser: o laço quente lê
+    # kinds[pos] direto, sem despacho de método peek/next por token
+    kinds = lex.kinds
+    values = lex.values
+    starts = lex.starts
+    n = len(kinds)
+    pos = 0
+    cache = {}  # (não-terminal, pos) -> (nó, nova pos)
+
+    def _memo(name, fn):
+        def wrapper():
+            nonlocal pos
+            key = (name, pos)
+            hit = cache.get(key)
+            if hit is not None:
+                pos = hit[1]
+                return hit[0]
+            node = fn()
+            cache[key] = (node, pos)
+            return node
+        return wrapper
+
+    def F():
+        nonlocal pos
+        kind = kinds[pos] if pos < n else _K_EOF
+        if kind == _K_NUMBER:
+            val = values[pos]
+            pos += 1
+            return Number(val)
+        if kind == _K_ID:
+            val = values[pos]
+            pos += 1
+            return Identifier(val)
+        if kind == _K_LPAREN:
+            pos += 1
+            node = E()
+            if pos >= n or kinds[pos] != _K_RPAREN:
+                raise SyntaxError("Parêntese de fechamento esperado")
+            pos += 1
+            return node
+        if pos < n:
+            tok = (_KIND_NAMES[kinds[pos]], values[pos])
+            raise SyntaxError(
+                f"Token inesperado em F: {tok} (posição {starts[pos]})"
+            )
+        raise SyntaxError(f"Token inesperado em F: {('EOF', '')}")
+
+    def T():
+        nonlocal pos
+        node = F()
+        while pos < n and _PREC_TAB[kinds[pos]] == 2:
+            op = _KIND_NAMES[kinds[pos]]
+            pos += 1
+            right = F()
+            node = BinOp(op, node, right)
+        return node
+
+    def E():
+        nonlocal pos
+        node = T()
+        while pos < n and _PREC_TAB[kinds[pos]] == 1:
+            op = _KIND_NAMES[kinds[pos]]
+            pos += 1
+            right = T()
+            node = BinOp(op, node, right)
+        return node
+
+    # memoiza só os não-terminais de ordem mais alta; F é primitivo demais
+    # para valer o custo de uma entrada no cache por posição
+    T = _memo("T", T)
+    E = _memo("E", E)
+
+    ast = E()
+    if pos != n:
+        raise SyntaxError(f"Entrada extra após expressão (posição {starts[pos]})")
+    return ast
+
+
+# formatadores por tipo de nó: o despacho vira uma única sonda de dict
+# pelo tipo exato, em vez de uma cadeia de isinstance por nó
+def _fmt_binop(node):
+    return f"BINOP {node.op}"
+
+
+def _fmt_num(node):
+    return f"NUMBER: {node.value}"
+
+
+def _fmt_id(node):
+    return f"ID: {node.name}"
+
+
+_FORMATTERS = {BinOp: _fmt_binop, Number: _fmt_num, Identifier: _fmt_id}
+
+
+def pretty_print_ast(node: AST, indent: int = 0):
+    # travessia com pilha explícita: nada de quadro de chamada por nó
+    # nem limite de recursão em árvores profundas (o filho direito entra
+    # antes para que o esquerdo seja impresso primeiro); as linhas são
+    # acumuladas e escritas de uma vez, um único write em vez de um
+    # print (e um flush) por nó
+    parts = []
+    emit = parts.append
+    get = _FORMATTERS.get
+    stack = [(node, indent)]
+    while stack:
+        node, indent = stack.pop()
+        cls = type(node)
+        fn = get(cls)
+        line = fn(node) if fn is not None else f"UNKNOWN_NODE: {node}"
+        emit("  " * indent + line)
+        if cls is BinOp:
+            stack.append((node.right, indent + 1))
+            stack.append((node.left, indent + 1))
+    sys.stdout.write("\n".join(parts) + "\n")
+
+
+# ========= Funções de interface (menu) =========
+def run_tokenizer_interactive():
+    print(_HDR.format("=== Tokenizador Interativo ==="))
+    src = input("Cole um trecho de código: ")
+    toks = tokenize(src)
+    if not toks:
+        print(_WARN.format("Nenhum token encontrado."))
+        return
+    # formata tudo em memória e escreve de uma vez: um único write
+    # em vez de um print por token
+    lines = []
+    for typ, val, pos in toks:
+        if typ == "ERROR":
+            lines.append(f"{Fore.RED}{pos:04d}: ERRO -> {val}")
+        else:
+            lines.append(f"{Fore.GREEN}{pos:04d}: {typ:8s} -> {val}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def run_afd_interactive():
+    print(_HDR.format("=== Simulador AFD (identificador) ==="))
+    s = input("Digite uma string para validar como identificador: ").strip()
+    ok = afd_identificador(s)
+    if ok:
+        print(_OK.format("ACEITO: é um identificador válido."))
+    else:
+        print(_ERR.format("REJEITADO: não é um identificador válido."))
+
+
+def run_parser_interactive():
+    print(_HDR.format("=== Parser de Expressões (recursivo-descendente) ==="))
+    expr = input("Digite uma expressão (ex: a + 3*(b-2)): ")
+    try:
+        ast = parse_expression(expr)
+        print(_OK.format("Árvore sintática:"))
+        pretty_print_ast(ast)
+    except Exception as e:
+        print(_ERR.format("Erro de sintaxe:"), e)
+
+
+def show_help():
+    print(_HDR.format("=== Ajuda Rápida ==="))
+    print("Comandos básicos: digite o número da opção e Enter.")
+    print("1 - Tokenizador\n2 - Simulador AFD\n3 - Parser\n4 - Sair")
+
+
+def main():
+    actions = {
+        "1": run_tokenizer_interactive,
+        "2": run_afd_interactive,
+        "3": run_parser_interactive,
+        "4": lambda: sys.exit(0),
+    }
+    while True:
+        print(_WARN.format("\n--- MENU PRINCIPAL ---"))
+        print("1) Tokenizador")
+        print("2) Simulador AFD")
+        print("3) Parser")
+        print("4) Sair")
+        choice = input("> ").strip()
+        action = actions.get(choice)
+        if action:
+            action()
+        else:
+            print(_ERR.format("Opção inválida. Tente novamente."))
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\nEncerrado pelo usuário.")